@@ -9,12 +9,17 @@
 # scapy.contrib.description = GMLAN Utilities
 # scapy.contrib.status = loads
 
+import heapq
+import os
+import struct
+import threading
 import time
 
-from scapy.compat import Optional, cast, Callable
+from scapy.compat import orb, Any, Callable, Dict, List, Optional, \
+    Set, Tuple, cast
 
 from scapy.contrib.automotive.gm.gmlan import GMLAN, GMLAN_SA, GMLAN_RD, \
-    GMLAN_TD, GMLAN_PM, GMLAN_RMBA
+    GMLAN_TD, GMLAN_PM, GMLAN_NR
 from scapy.config import conf
 from scapy.packet import Packet
 from scapy.contrib.isotp import ISOTPSocket
@@ -37,40 +42,308 @@ except KeyError:
     conf.contribs['GMLAN'] = {'treat-response-pending-as-answer': False}
 
 
-# Helper function
+# Helper functions
+def _first_byte_filter(expected):
+    # type: (Set[int]) -> Callable[[Packet], bool]
+    """ Return an lfilter that rejects frames on their first wire byte.
+
+    The check runs on the raw bytes kept from dissection, so unrelated
+    traffic on a busy bus is dropped without walking any packet layers.
+    """
+    def _filter(p):
+        # type: (Packet) -> bool
+        data = p.original or bytes(p)
+        return bool(data) and orb(data[0]) in expected
+    return _filter
+
+
+_td_response_prefilter = _first_byte_filter({0x76, 0x7f})
+
+
+def _is_td_response(p):
+    # type: (Packet) -> bool
+    """ Match positive or final negative TransferData responses. """
+    if not _td_response_prefilter(p):
+        return False
+    if p.service == 0x76:
+        return True
+    # A truncated 0x7f frame dissects without a GMLAN_NR layer; treat it
+    # as noise instead of raising on the missing fields.
+    nr = p.getlayer(GMLAN_NR)
+    return nr is not None and \
+        nr.requestServiceId == 0x36 and nr.returnCode != 0x78
+
+
+def _fast_sender(sock):
+    # type: (ISOTPSocket) -> Callable[[bytes], Any]
+    """ Return the fastest callable sending raw bytes on sock.
+
+    On a kernel CAN_ISOTP socket the prepared bytes can be written
+    straight to the file descriptor, skipping the packet send path. Any
+    other socket type falls back to sock.send, which accepts bytes too.
+    """
+    outs = getattr(sock, "outs", None)
+    if outs is not None and \
+            sock.__class__.__name__ == "ISOTPNativeSocket" and \
+            hasattr(outs, "fileno"):
+        fd = outs.fileno()
+        return lambda b: os.write(fd, b)
+    return sock.send
+
+
+def _recv_with_timeout(sock, timeout):
+    # type: (ISOTPSocket, Optional[float]) -> Optional[Packet]
+    """ Receive a single packet directly from the socket.
+
+    Waits on the socket's own select and reads one packet, avoiding the
+    session and bookkeeping overhead of a full sniff() for a single frame.
+    Returns None on timeout.
+    """
+    ready, _ = sock.select([sock], timeout)
+    if ready:
+        return sock.recv()
+    return None
+
+
+_RMBA_TEMPLATES = {}  # type: Dict[Tuple[int, int], Tuple[bytes, int, int]]  # noqa: E501
+
+
+def _rmba_template(length, scheme):
+    # type: (int, int) -> Tuple[bytearray, int, int]
+    """ Return (template, addr_offset, addr_len) for a ReadMemoryByAddress
+    request with fixed memorySize.
+
+    The request bytes are cached, so address scans only patch the
+    address bytes of a copy instead of constructing and serializing a new
+    packet for every address. The frame is packed directly for the
+    caller-resolved scheme (one service byte, an address of scheme bytes
+    and a two byte memorySize), so the wire format always matches the
+    width the address was validated against, independent of
+    conf.contribs['GMLAN'] at call time."""
+    key = (length, scheme)
+    try:
+        template, addr_offset, addr_len = _RMBA_TEMPLATES[key]
+    except KeyError:
+        template = b"\x23" + b"\x00" * scheme + struct.pack("!H", length)
+        addr_offset, addr_len = 1, scheme
+        _RMBA_TEMPLATES[key] = (template, addr_offset, addr_len)
+    return bytearray(template), addr_offset, addr_len
+
+
+def _brief(resp):
+    # type: (Packet) -> str
+    """ One-line summary of a response, cheap enough for chatty loops. """
+    if resp.service == 0x7f:
+        return "svc=%#x rc=%#x" % (resp.service, resp.returnCode)
+    return "svc=%#x" % resp.service
+
+
+def _show_response(resp, verbose):
+    # type: (Packet, Optional[int]) -> None
+    # A full show() formats every field recursively and dominates the
+    # runtime of large scans; only do that for verbose=True or from
+    # verbosity 2 upwards.
+    if verbose is True or (verbose is not None and verbose > 1):
+        resp.show()
+    elif verbose:
+        print(_brief(resp))
+
+
 def _check_response(resp, verbose):
-    # type: (Packet, Optional[bool]) -> bool
+    # type: (Packet, Optional[int]) -> bool
     if resp is None:
         if verbose:
             print("Timeout.")
         return False
-    if verbose:
-        resp.show()
+    _show_response(resp, verbose)
     return resp.service != 0x7f  # NegativeResponse
 
 
+def _sr1_with_retry(sock, pkt, timeout, verbose, retry):
+    # type: (ISOTPSocket, Packet, Optional[int], Optional[int], int) -> Optional[Packet]  # noqa: E501
+    """ Send a request until a positive response arrives.
+
+    Implements the shared retry loop of the request/response helpers:
+    returns the positive response, or None once the retry budget is used
+    up by timeouts or negative responses. A broken transport (closed or
+    failed socket) aborts immediately instead of burning the remaining
+    retries against a dead bus.
+    """
+    attempts = max(retry, 0) + 1
+    for attempt in range(attempts):
+        try:
+            resp = sock.sr1(pkt, timeout=timeout, verbose=0)
+        except (OSError, EOFError) as e:
+            if verbose:
+                print("Socket failure: %s" % e)
+            return None
+        if _check_response(resp, verbose):
+            return resp
+        if attempt < attempts - 1 and verbose:
+            print("Retrying..")
+    return None
+
+
+class _TesterPresentScheduler(object):
+    """ Singleton driving all GMLAN_TesterPresentSender objects from one
+    daemon thread.
+
+    Every sender only wakes up once per interval, so multiplexing them over
+    a min-heap of deadlines removes the per-socket OS thread (stack, context
+    switches) without changing the traffic on the bus.
+    """
+
+    _instance = None  # type: Optional[_TesterPresentScheduler]
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        # type: () -> _TesterPresentScheduler
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def __init__(self):
+        # type: () -> None
+        self._condition = threading.Condition()
+        # min-heap of (deadline, seq, sender)
+        self._queue = []  # type: List[Tuple[float, int, GMLAN_TesterPresentSender]]  # noqa: E501
+        self._seq = 0
+        self._thread = None  # type: Optional[threading.Thread]
+
+    def register(self, sender):
+        # type: (GMLAN_TesterPresentSender) -> None
+        with self._condition:
+            heapq.heappush(self._queue, (time.time(), self._seq, sender))
+            self._seq += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="GMLAN_TesterPresentScheduler")
+                self._thread.daemon = True
+                self._thread.start()
+            self._condition.notify()
+
+    def notify(self):
+        # type: () -> None
+        """ Wake the scheduler, e.g. after a sender was stopped. """
+        with self._condition:
+            self._condition.notify()
+
+    def _run(self):
+        # type: () -> None
+        while True:
+            with self._condition:
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+                deadline, _, sender = self._queue[0]
+                if sender.stopped():
+                    heapq.heappop(self._queue)
+                    sender._retired.set()
+                    continue
+                now = time.time()
+                if deadline > now:
+                    self._condition.wait(deadline - now)
+                    continue
+                heapq.heappop(self._queue)
+            # Send outside the lock; a slow socket must not stall the
+            # deadlines of the other senders longer than necessary.
+            try:
+                sender._trigger()
+            except Exception as e:
+                # One broken socket must not kill the keepalives of all
+                # other registered senders; drop only the failing one.
+                warning("GMLAN_TesterPresentSender dropped after "
+                        "send error: %s", e)
+                sender.stop()
+                sender._retired.set()
+                continue
+            with self._condition:
+                if sender.stopped():
+                    sender._retired.set()
+                else:
+                    heapq.heappush(self._queue,
+                                   (time.time() + sender._interval,
+                                    self._seq, sender))
+                    self._seq += 1
+
+
 class GMLAN_TesterPresentSender(PeriodicSenderThread):
 
     def __init__(self, sock, pkt=GMLAN(service="TesterPresent"), interval=2):
         # type: (ISOTPSocket, Packet, int) -> None
-        """ Thread to send GMLAN TesterPresent packets periodically
+        """ Periodic sender for GMLAN TesterPresent packets.
+
+        All senders share one background thread; see
+        _TesterPresentScheduler.
 
         :param sock: socket where packet is sent periodically
         :param pkt: packet to send
         :param interval: interval between two packets
         """
         PeriodicSenderThread.__init__(self, sock, pkt, interval)
+        # Serialize the packets once. Re-dissecting the built bytes primes
+        # raw_packet_cache, so every send reuses the cached wire format
+        # instead of re-running build().
+        self._pkts = [p.__class__(bytes(p))
+                      for p in self._pkts]  # type: List[Packet]
+        self._registered = False
+        # Set by the scheduler once it will not touch this sender again.
+        self._retired = threading.Event()
+
+    def stopped(self):
+        # type: () -> bool
+        return self._stopped.is_set()
+
+    def stop(self):
+        # type: () -> None
+        PeriodicSenderThread.stop(self)
+        if self._registered:
+            # Wake the scheduler so the sender is retired promptly.
+            _TesterPresentScheduler.instance().notify()
+        else:
+            self._retired.set()
+
+    def _trigger(self):
+        # type: () -> None
+        for p in self._pkts:
+            if self._stopped.is_set():
+                break
+            self._socket.sr1(p, verbose=False, timeout=0.1)
+
+    def start(self):
+        # type: () -> None
+        if self._registered:
+            raise RuntimeError("threads can only be started once")
+        self._registered = True
+        _TesterPresentScheduler.instance().register(self)
+
+    def is_alive(self):
+        # type: () -> bool
+        return self._registered and not self._stopped.is_set()
+
+    def join(self, timeout=None):
+        # type: (Optional[float]) -> None
+        # No dedicated OS thread to wait for, but the shared scheduler
+        # may still be inside this sender's _trigger() using the socket.
+        # Wait until the scheduler has retired the sender, which is the
+        # point where a dedicated thread would have terminated.
+        if not self._registered:
+            raise RuntimeError("cannot join thread before it is started")
+        self._retired.wait(timeout)
 
     def run(self):
         # type: () -> None
+        # Kept for direct Thread usage; start() normally bypasses this in
+        # favor of the shared scheduler.
         while not self._stopped.is_set():
-            for p in self._pkts:
-                self._socket.sr1(p, verbose=False, timeout=0.1)
-                time.sleep(self._interval)
+            self._trigger()
+            time.sleep(self._interval)
 
 
-def GMLAN_InitDiagnostics(sock, broadcast_socket=None, timeout=None, verbose=None, retry=0):  # noqa: E501
-    # type: (ISOTPSocket, Optional[ISOTPSocket], Optional[int], Optional[bool], int) -> bool  # noqa: E501
+def GMLAN_InitDiagnostics(sock, broadcast_socket=None, timeout=None, verbose=None, retry=0, post_send_gap=0.05):  # noqa: E501
+    # type: (ISOTPSocket, Optional[ISOTPSocket], Optional[int], Optional[int], int, float) -> bool  # noqa: E501
     """ Send messages to put an ECU into diagnostic/programming state.
 
     :param sock: socket for communication.
@@ -78,20 +351,25 @@ def GMLAN_InitDiagnostics(sock, broadcast_socket=None, timeout=None, verbose=Non
                              will be sent as broadcast. Recommended when used
                              on a network with several ECUs.
     :param timeout: timeout for sending, receiving or sniffing packages.
-    :param verbose: set verbosity level
+    :param verbose: verbosity level. 1 prints one-line response
+                    summaries; True or values above 1 dump full
+                    responses via show().
     :param retry: number of retries in case of failure.
+    :param post_send_gap: settle time granted to the ECU after each step.
+                          The default of 0.05 s is the conservative GMLAN
+                          worst case; fast ECUs can use a smaller gap.
     :return: True on success else False
     """
     # Helper function
     def _send_and_check_response(sock, req, timeout, verbose):
-        # type: (ISOTPSocket, Packet, Optional[int], Optional[bool]) -> bool
+        # type: (ISOTPSocket, Packet, Optional[int], Optional[int]) -> bool
         if verbose:
             print("Sending %s" % repr(req))
         resp = sock.sr1(req, timeout=timeout, verbose=False)
         return _check_response(resp, verbose)
 
     if verbose is None:
-        verbose = conf.verb > 0
+        verbose = conf.verb
     retry = abs(retry)
 
     while retry >= 0:
@@ -106,7 +384,7 @@ def GMLAN_InitDiagnostics(sock, broadcast_socket=None, timeout=None, verbose=Non
             if verbose:
                 print("Sending %s as broadcast" % repr(p))
             broadcast_socket.send(p)
-        time.sleep(0.05)
+        time.sleep(post_send_gap)
 
         # ReportProgrammedState
         p = GMLAN(service="ReportProgrammingState")
@@ -116,7 +394,7 @@ def GMLAN_InitDiagnostics(sock, broadcast_socket=None, timeout=None, verbose=Non
         p = GMLAN() / GMLAN_PM(subfunction="requestProgrammingMode")
         if not _send_and_check_response(sock, p, timeout, verbose):
             continue
-        time.sleep(0.05)
+        time.sleep(post_send_gap)
 
         # InitiateProgramming enableProgramming
         # No response expected
@@ -124,25 +402,32 @@ def GMLAN_InitDiagnostics(sock, broadcast_socket=None, timeout=None, verbose=Non
         if verbose:
             print("Sending %s" % repr(p))
         sock.send(p)
-        time.sleep(0.05)
+        time.sleep(post_send_gap)
         return True
     return False
 
 
-def GMLAN_GetSecurityAccess(sock, key_function, level=1, timeout=None, verbose=None, retry=0):  # noqa: E501
-    # type: (ISOTPSocket, Callable[[int], int], int, Optional[int], Optional[bool], int) -> bool  # noqa: E501
+def GMLAN_GetSecurityAccess(sock, key_function, level=1, timeout=None, verbose=None, retry=0, precompute_table=None):  # noqa: E501
+    # type: (ISOTPSocket, Callable[[int], int], int, Optional[int], Optional[int], int, Optional[Dict[int, int]]) -> bool  # noqa: E501
     """ Authenticate on ECU. Implements Seey-Key procedure.
 
     :param sock: socket to send the message on.
-    :param key_function: function implementing the key algorithm.
+    :param key_function: function implementing the key algorithm. May also
+                         return a concurrent.futures.Future; the result is
+                         then awaited right before the key is sent, so the
+                         computation overlaps any verbose output.
     :param level: level of access
     :param timeout: timeout for sending, receiving or sniffing packages.
-    :param verbose: set verbosity level
+    :param verbose: verbosity level. 1 prints one-line response
+                    summaries; True or values above 1 dump full
+                    responses via show().
     :param retry: number of retries in case of failure.
+    :param precompute_table: optional seed to key mapping which
+                             short-circuits key_function for known seeds.
     :return: True on success.
     """
     if verbose is None:
-        verbose = conf.verb > 0
+        verbose = conf.verb
     retry = abs(retry)
 
     if key_function is None:
@@ -159,6 +444,20 @@ def GMLAN_GetSecurityAccess(sock, key_function, level=1, timeout=None, verbose=N
         if verbose:
             print("Requesting seed..")
         resp = sock.sr1(request, timeout=timeout, verbose=0)
+
+        # Kick off the key computation as soon as the seed is known, so an
+        # expensive key_function (or a Future it returns) overlaps the
+        # verbose output below.
+        seed = None
+        key = None  # type: Any
+        if resp is not None and resp.service != 0x7f:
+            seed = resp.securitySeed
+            if seed != 0:
+                if precompute_table is not None and seed in precompute_table:
+                    key = precompute_table[seed]
+                else:
+                    key = key_function(seed)
+
         if not _check_response(resp, verbose):
             if resp is not None and resp.returnCode == 0x37 and retry:
                 if verbose:
@@ -168,14 +467,15 @@ def GMLAN_GetSecurityAccess(sock, key_function, level=1, timeout=None, verbose=N
                 print("Negative Response.")
             continue
 
-        seed = resp.securitySeed
         if seed == 0:
             if verbose:
                 print("ECU security already unlocked. (seed is 0x0000)")
             return True
 
+        if hasattr(key, "result"):
+            key = key.result()
         keypkt = GMLAN() / GMLAN_SA(subfunction=level + 1,
-                                    securityKey=key_function(seed))
+                                    securityKey=key)
         if verbose:
             print("Responding with key..")
         resp = sock.sr1(keypkt, timeout=timeout, verbose=0)
@@ -183,8 +483,7 @@ def GMLAN_GetSecurityAccess(sock, key_function, level=1, timeout=None, verbose=N
             if verbose:
                 print("Timeout.")
             continue
-        if verbose:
-            resp.show()
+        _show_response(resp, verbose)
         if resp.sprintf("%GMLAN.service%") == "SecurityAccessPositiveResponse":   # noqa: E501
             if verbose:
                 print("SecurityAccess granted.")
@@ -200,7 +499,7 @@ def GMLAN_GetSecurityAccess(sock, key_function, level=1, timeout=None, verbose=N
 
 
 def GMLAN_RequestDownload(sock, length, timeout=None, verbose=None, retry=0):
-    # type: (ISOTPSocket, int, Optional[int], Optional[bool], int) -> bool
+    # type: (ISOTPSocket, int, Optional[int], Optional[int], int) -> bool
     """ Send RequestDownload message.
 
         Usually used before calling TransferData.
@@ -208,49 +507,107 @@ def GMLAN_RequestDownload(sock, length, timeout=None, verbose=None, retry=0):
     :param sock: socket to send the message on.
     :param length: value for the message's parameter 'unCompressedMemorySize'.
     :param timeout: timeout for sending, receiving or sniffing packages.
-    :param verbose: set verbosity level.
+    :param verbose: verbosity level. 1 prints one-line response
+                    summaries; True or values above 1 dump full
+                    responses via show().
     :param retry: number of retries in case of failure.
     :return: True on success
     """
     if verbose is None:
-        verbose = conf.verb > 0
+        verbose = conf.verb
     retry = abs(retry)
 
-    while retry >= 0:
-        # RequestDownload
-        pkt = GMLAN() / GMLAN_RD(memorySize=length)
-        resp = sock.sr1(pkt, timeout=timeout, verbose=0)
-        if _check_response(resp, verbose):
-            return True
-        retry -= 1
-        if retry >= 0 and verbose:
-            print("Retrying..")
-    return False
+    # RequestDownload
+    pkt = GMLAN() / GMLAN_RD(memorySize=length)
+    return _sr1_with_retry(sock, pkt, timeout, verbose, retry) is not None
+
 
+def _GMLAN_TransferData_pipelined(sock, pkts, window, timeout, verbose, retry):  # noqa: E501
+    # type: (ISOTPSocket, List[Packet], int, Optional[int], Optional[int], int) -> bool  # noqa: E501
+    """ Send prebuilt TransferData packets pipelined.
 
-def GMLAN_TransferData(sock, addr, payload, maxmsglen=None, timeout=None, verbose=None, retry=0):  # noqa: E501
-    # type: (ISOTPSocket, int, bytes, Optional[int], Optional[int], Optional[bool], int) -> bool  # noqa: E501
+    Up to `window` requests are put on the bus back-to-back before their
+    acknowledgements are collected, bounding the transfer by bus bandwidth
+    instead of one round-trip per chunk.
+
+    TransferData positive responses carry no address, so acknowledgements
+    can only be counted, not matched to chunks. If a burst does not
+    collect a clean positive response per chunk, the whole burst is
+    re-sent on the strict send-and-wait path: re-transferring an already
+    written chunk is harmless, silently skipping one is not.
+    """
+    send_raw = _fast_sender(sock)
+    wire = [bytes(p) for p in pkts]
+
+    i = 0
+    while i < len(pkts):
+        burst = pkts[i:i + window]
+        for w in wire[i:i + window]:
+            send_raw(w)
+        deadline = None if timeout is None \
+            else time.time() + timeout * len(burst)
+        acked = 0
+        while acked < len(burst):
+            remain = None if deadline is None else deadline - time.time()
+            if remain is not None and remain <= 0:
+                break
+            r = _recv_with_timeout(sock, remain)
+            if r is None:
+                break
+            if not _is_td_response(r):
+                continue
+            if r.service != 0x76:
+                break
+            acked += 1
+        if acked < len(burst):
+            # Short ack count: re-send the complete burst synchronously,
+            # honoring the retry budget per chunk.
+            for p in burst:
+                if _sr1_with_retry(sock, p, timeout, verbose, retry) is None:
+                    return False
+        i += len(burst)
+    return True
+
+
+def GMLAN_TransferData(sock, addr, payload, maxmsglen=None, timeout=None, verbose=None, retry=0, window=1, scheme=None):  # noqa: E501
+    # type: (ISOTPSocket, int, bytes, Optional[int], Optional[int], Optional[int], int, int, Optional[int]) -> bool  # noqa: E501
     """ Send TransferData message.
 
     Usually used after calling RequestDownload.
 
     :param sock: socket to send the message on.
     :param addr: destination memory address on the ECU.
-    :param payload: data to be sent.
+    :param payload: data to be sent. Any bytes-like object (bytes,
+                    bytearray, memoryview or mmap.mmap) is accepted;
+                    large images can be handed over without loading them
+                    into the heap first.
     :param maxmsglen: maximum length of a single iso-tp message.
                       default: maximum length
     :param timeout: timeout for sending, receiving or sniffing packages.
-    :param verbose: set verbosity level.
+    :param verbose: verbosity level. 1 prints one-line response
+                    summaries; True or values above 1 dump full
+                    responses via show().
     :param retry: number of retries in case of failure.
+    :param window: number of in-flight TransferData requests. The default
+                   of 1 waits for every acknowledgement before the next
+                   chunk is sent; larger values pipeline the requests.
+                   Pipelining assumes an ECU that processes and
+                   acknowledges the requests strictly in order, since the
+                   positive responses carry no address. A burst whose ack
+                   count comes up short is re-sent in its entirety on the
+                   strict path.
+    :param scheme: addressing scheme; resolved from
+                   conf.contribs['GMLAN'] if not given. Callers in tight
+                   loops can pass it to skip the lookup.
     :return: True on success.
     """
     if verbose is None:
-        verbose = conf.verb > 0
+        verbose = conf.verb
 
     retry = abs(retry)
-    startretry = retry
 
-    scheme = conf.contribs['GMLAN']['GMLAN_ECU_AddressingScheme']
+    if scheme is None:
+        scheme = conf.contribs['GMLAN']['GMLAN_ECU_AddressingScheme']
     if addr < 0 or addr >= 2**(8 * scheme):
         warning("Error: Invalid address %s for scheme %s",
                 hex(addr), str(scheme))
@@ -262,70 +619,82 @@ def GMLAN_TransferData(sock, addr, payload, maxmsglen=None, timeout=None, verbos
 
     maxmsglen = cast(int, maxmsglen)
 
-    for i in range(0, len(payload), maxmsglen):
-        retry = startretry
-        while True:
-            if len(payload[i:]) > maxmsglen:
-                transdata = payload[i:i + maxmsglen]
-            else:
-                transdata = payload[i:]
-            pkt = GMLAN() / GMLAN_TD(startingAddress=addr + i,
-                                     dataRecord=transdata)
-            resp = sock.sr1(pkt, timeout=timeout, verbose=0)
-            if _check_response(resp, verbose):
-                break
-            retry -= 1
-            if retry >= 0:
-                if verbose:
-                    print("Retrying..")
-            else:
-                return False
+    # Slice the payload once through a memoryview. The slices stay
+    # zero-copy views (also for mmap'ed firmware images); the bytes are
+    # only materialized where the GMLAN_TD field needs them.
+    mv = memoryview(payload)
+    chunks = [(i, mv[i:i + maxmsglen])
+              for i in range(0, len(payload), maxmsglen)]
+
+    if window > 1:
+        pkts = [GMLAN() / GMLAN_TD(startingAddress=addr + i,
+                                   dataRecord=bytes(transdata))
+                for i, transdata in chunks]
+        return _GMLAN_TransferData_pipelined(sock, pkts, window, timeout,
+                                             verbose, retry)
+
+    for i, transdata in chunks:
+        pkt = GMLAN() / GMLAN_TD(startingAddress=addr + i,
+                                 dataRecord=bytes(transdata))
+        if _sr1_with_retry(sock, pkt, timeout, verbose, retry) is None:
+            return False
 
     return True
 
 
 def GMLAN_TransferPayload(sock, addr, payload, maxmsglen=None, timeout=None,
-                          verbose=None, retry=0):
-    # type: (ISOTPSocket, int, bytes, Optional[int], Optional[int], Optional[bool], int) -> bool  # noqa: E501
+                          verbose=None, retry=0, window=1):
+    # type: (ISOTPSocket, int, bytes, Optional[int], Optional[int], Optional[int], int, int) -> bool  # noqa: E501
     """ Send data by using GMLAN services.
 
     :param sock: socket to send the data on.
     :param addr: destination memory address on the ECU.
-    :param payload: data to be sent.
+    :param payload: data to be sent. Any bytes-like object (bytes,
+                    bytearray, memoryview or mmap.mmap) is accepted.
     :param maxmsglen: maximum length of a single iso-tp message.
                       default: maximum length
     :param timeout: timeout for sending, receiving or sniffing packages.
-    :param verbose: set verbosity level.
+    :param verbose: verbosity level. 1 prints one-line response
+                    summaries; True or values above 1 dump full
+                    responses via show().
     :param retry: number of retries in case of failure.
+    :param window: number of in-flight TransferData requests.
     :return: True on success.
     """
     if not GMLAN_RequestDownload(sock, len(payload), timeout=timeout,
                                  verbose=verbose, retry=retry):
         return False
     if not GMLAN_TransferData(sock, addr, payload, maxmsglen=maxmsglen,
-                              timeout=timeout, verbose=verbose, retry=retry):
+                              timeout=timeout, verbose=verbose, retry=retry,
+                              window=window):
         return False
     return True
 
 
 def GMLAN_ReadMemoryByAddress(sock, addr, length, timeout=None,
-                              verbose=None, retry=0):
-    # type: (ISOTPSocket, int, int, Optional[int], Optional[bool], int) -> Optional[bytes]  # noqa: E501
+                              verbose=None, retry=0, scheme=None):
+    # type: (ISOTPSocket, int, int, Optional[int], Optional[int], int, Optional[int]) -> Optional[bytes]  # noqa: E501
     """ Read data from ECU memory.
 
     :param sock: socket to send the data on.
     :param addr: source memory address on the ECU.
     :param length: bytes to read.
     :param timeout: timeout for sending, receiving or sniffing packages.
-    :param verbose: set verbosity level.
+    :param verbose: verbosity level. 1 prints one-line response
+                    summaries; True or values above 1 dump full
+                    responses via show().
     :param retry: number of retries in case of failure.
+    :param scheme: addressing scheme; resolved from
+                   conf.contribs['GMLAN'] if not given. Callers in tight
+                   loops can pass it to skip the lookup.
     :return: bytes red or None
     """
     if verbose is None:
-        verbose = conf.verb > 0
+        verbose = conf.verb
     retry = abs(retry)
 
-    scheme = conf.contribs['GMLAN']['GMLAN_ECU_AddressingScheme']
+    if scheme is None:
+        scheme = conf.contribs['GMLAN']['GMLAN_ECU_AddressingScheme']
     if addr < 0 or addr >= 2**(8 * scheme):
         warning("Error: Invalid address %s for scheme %s",
                 hex(addr), str(scheme))
@@ -338,16 +707,16 @@ def GMLAN_ReadMemoryByAddress(sock, addr, length, timeout=None,
                 hex(length), str(scheme), hex(4094 - scheme))
         return None
 
-    while retry >= 0:
-        # RequestDownload
-        pkt = GMLAN() / GMLAN_RMBA(memoryAddress=addr, memorySize=length)
-        resp = sock.sr1(pkt, timeout=timeout, verbose=0)
-        if _check_response(resp, verbose):
-            return resp.dataRecord
-        retry -= 1
-        if retry >= 0 and verbose:
-            print("Retrying..")
-    return None
+    # ReadMemoryByAddress, built from the cached wire template. Dissecting
+    # the patched bytes also primes raw_packet_cache for sr1.
+    buf, addr_offset, addr_len = _rmba_template(length, scheme)
+    for k in range(addr_len):
+        buf[addr_offset + k] = (addr >> (8 * (addr_len - 1 - k))) & 0xff
+    pkt = GMLAN(bytes(buf))
+    resp = _sr1_with_retry(sock, pkt, timeout, verbose, retry)
+    if resp is None:
+        return None
+    return resp.dataRecord
 
 
 def GMLAN_BroadcastSocket(interface):
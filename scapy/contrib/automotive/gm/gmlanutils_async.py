@@ -0,0 +1,83 @@
+#! /usr/bin/env python
+
+# This file is part of Scapy
+# See http://www.secdev.org/projects/scapy for more information
+# This program is published under a GPLv2 license
+
+# scapy.contrib.description = GMLAN Utilities (asyncio wrappers)
+# scapy.contrib.status = loads
+
+"""
+Awaitable wrappers around the blocking GMLAN utility functions.
+
+The synchronous helpers in scapy.contrib.automotive.gm.gmlanutils spend
+most of their time sleeping or waiting for ECU responses. When several
+ECUs have to be initialized, unlocked or flashed, running them one after
+another adds up all those waits. The wrappers below off-load each call
+to the event loop's default executor and return an awaitable, so N ECUs
+can be handled concurrently from one thread::
+
+    results = await asyncio.gather(
+        GMLAN_InitDiagnosticsAsync(sock1, timeout=1),
+        GMLAN_InitDiagnosticsAsync(sock2, timeout=1))
+
+Every wrapper accepts exactly the arguments of its blocking counterpart.
+Do not share one socket between concurrent calls.
+
+This module requires Python 3; on Python 2 it is empty.
+"""
+
+import scapy.modules.six as six
+
+from scapy.compat import List
+
+__all__ = []  # type: List[str]
+
+if six.PY3:
+    import asyncio
+    import functools
+
+    from scapy.contrib.automotive.gm.gmlanutils import \
+        GMLAN_InitDiagnostics, GMLAN_GetSecurityAccess, \
+        GMLAN_RequestDownload, GMLAN_TransferData, GMLAN_TransferPayload, \
+        GMLAN_ReadMemoryByAddress
+
+    __all__ += ["GMLAN_InitDiagnosticsAsync", "GMLAN_GetSecurityAccessAsync",
+                "GMLAN_RequestDownloadAsync", "GMLAN_TransferDataAsync",
+                "GMLAN_TransferPayloadAsync", "GMLAN_ReadMemoryByAddressAsync"]
+
+    def _in_executor(func, *args, **kwargs):
+        # type: (...) -> asyncio.Future
+        loop = asyncio.get_event_loop()
+        return loop.run_in_executor(
+            None, functools.partial(func, *args, **kwargs))
+
+    def GMLAN_InitDiagnosticsAsync(*args, **kwargs):
+        # type: (...) -> asyncio.Future
+        """ Awaitable variant of GMLAN_InitDiagnostics. """
+        return _in_executor(GMLAN_InitDiagnostics, *args, **kwargs)
+
+    def GMLAN_GetSecurityAccessAsync(*args, **kwargs):
+        # type: (...) -> asyncio.Future
+        """ Awaitable variant of GMLAN_GetSecurityAccess. """
+        return _in_executor(GMLAN_GetSecurityAccess, *args, **kwargs)
+
+    def GMLAN_RequestDownloadAsync(*args, **kwargs):
+        # type: (...) -> asyncio.Future
+        """ Awaitable variant of GMLAN_RequestDownload. """
+        return _in_executor(GMLAN_RequestDownload, *args, **kwargs)
+
+    def GMLAN_TransferDataAsync(*args, **kwargs):
+        # type: (...) -> asyncio.Future
+        """ Awaitable variant of GMLAN_TransferData. """
+        return _in_executor(GMLAN_TransferData, *args, **kwargs)
+
+    def GMLAN_TransferPayloadAsync(*args, **kwargs):
+        # type: (...) -> asyncio.Future
+        """ Awaitable variant of GMLAN_TransferPayload. """
+        return _in_executor(GMLAN_TransferPayload, *args, **kwargs)
+
+    def GMLAN_ReadMemoryByAddressAsync(*args, **kwargs):
+        # type: (...) -> asyncio.Future
+        """ Awaitable variant of GMLAN_ReadMemoryByAddress. """
+        return _in_executor(GMLAN_ReadMemoryByAddress, *args, **kwargs)